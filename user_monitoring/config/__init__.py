@@ -8,6 +8,7 @@ from .constants import (
     LeverageType,
     DatabaseConfig,
     APIConfig,
+    BatchConfig,
     ProcessingIntervals,
     FileConfig,
     LogConfig,
@@ -16,7 +17,8 @@ from .constants import (
     SYSTEM_ADDRESSES,
     ADDRESS_LENGTH,
     ADDRESS_PREFIX,
-    HEX_CHARS
+    HEX_CHARS,
+    ADDRESS_CACHE_SIZE
 )
 from .logging_config import LoggingSetup, setup_logging
 
@@ -28,6 +30,7 @@ __all__ = [
     'LeverageType',
     'DatabaseConfig',
     'APIConfig',
+    'BatchConfig',
     'ProcessingIntervals',
     'FileConfig',
     'LogConfig',
@@ -37,6 +40,7 @@ __all__ = [
     'ADDRESS_LENGTH',
     'ADDRESS_PREFIX',
     'HEX_CHARS',
+    'ADDRESS_CACHE_SIZE',
     'LoggingSetup',
     'setup_logging'
 ]
\ No newline at end of file
@@ -5,6 +5,8 @@ from typing import List, Optional
 from dataclasses import dataclass
 import logging
 
+from config.constants import DatabaseConfig
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -31,6 +33,9 @@ class MonitorConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     snapshot_retention_count: int = 2
+    db_min_pool_size: int = DatabaseConfig.MIN_POOL_SIZE
+    db_max_pool_size: int = DatabaseConfig.MAX_POOL_SIZE
+    db_statement_cache_size: int = DatabaseConfig.STATEMENT_CACHE_SIZE
 
     def reload_markets(self) -> bool:
         import os
@@ -65,6 +70,13 @@ class MonitorConfig:
         active_addresses_file = data_dir / "active_addresses.txt"
         nvn_api_url = os.getenv("NVN_API_URL", "http://127.0.0.1:3001/info")
         public_api_url = os.getenv("PUBLIC_API_URL", "https://api.hyperliquid.xyz/info")
+        max_workers = int(os.getenv("MAX_WORKERS", "10"))
+
+        # Size the pool from concurrency so workers don't queue for connections
+        db_max_pool_size = int(os.getenv("DB_MAX_POOL",
+                                         str(max(DatabaseConfig.MAX_POOL_SIZE, 2 * max_workers))))
+        db_min_pool_size = int(os.getenv("DB_MIN_POOL",
+                                         str(max(DatabaseConfig.MIN_POOL_SIZE, db_max_pool_size // 4))))
 
         config = cls(
             database_url=database_url,
@@ -83,10 +95,14 @@ class MonitorConfig:
             snapshot_check_interval=int(os.getenv("SNAPSHOT_CHECK_INTERVAL", "120")),
             position_refresh_interval=int(os.getenv("POSITION_REFRESH_INTERVAL", "10")),
             position_refresh_batch_size=int(os.getenv("POSITION_REFRESH_BATCH_SIZE", "500")),
-            max_workers=int(os.getenv("MAX_WORKERS", "10")),
+            max_workers=max_workers,
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("RETRY_DELAY", "1.0")),
-            snapshot_retention_count=int(os.getenv("SNAPSHOT_RETENTION_COUNT", "2"))
+            snapshot_retention_count=int(os.getenv("SNAPSHOT_RETENTION_COUNT", "2")),
+            db_min_pool_size=db_min_pool_size,
+            db_max_pool_size=db_max_pool_size,
+            db_statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE",
+                                                  str(DatabaseConfig.STATEMENT_CACHE_SIZE)))
         )
 
         config.validate()
@@ -133,6 +149,12 @@ class MonitorConfig:
         if self.min_position_value_usd < 0:
             raise ValueError("MIN_POSITION_VALUE_USD must be non-negative")
 
+        if not 0 < self.db_min_pool_size <= self.db_max_pool_size:
+            raise ValueError("DB_MIN_POOL must be positive and not exceed DB_MAX_POOL")
+
+        if self.db_statement_cache_size < 0:
+            raise ValueError("DB_STATEMENT_CACHE_SIZE must be non-negative")
+
         if not self.node_binary_path.exists():
             logger.warning(f"Node binary not found at {self.node_binary_path}")
             logger.warning("RMP conversion will fail. Please ensure hl-node is installed")
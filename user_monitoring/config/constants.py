@@ -1,28 +1,29 @@
 """Constants and enums for Hyperliquid Position Monitoring System."""
 from enum import Enum
-from typing import Set
+from typing import Final, FrozenSet
 
 # =============================================================================
 # SYSTEM ADDRESSES
 # =============================================================================
 
-SYSTEM_ADDRESSES: Set[str] = {
+SYSTEM_ADDRESSES: Final[FrozenSet[str]] = frozenset({
     '0x0000000000000000000000000000000000000000',
     '0x0000000000000000000000000000000000000001',
     '0x000000000000000000000000000000000000dead',
     '0xffffffffffffffffffffffffffffffffffffffff',
-}
+})
 
 
 # =============================================================================
 # VALIDATION CONSTANTS
 # =============================================================================
 
-ADDRESS_LENGTH = 42
-ADDRESS_PREFIX = '0x'
-HEX_CHARS = '0123456789abcdefABCDEF'
-MIN_RMP_FILE_SIZE = 1000
-MIN_JSON_FILE_SIZE = 1000
+ADDRESS_LENGTH: Final = 42
+ADDRESS_PREFIX: Final = '0x'
+HEX_CHARS: Final = '0123456789abcdefABCDEF'
+ADDRESS_CACHE_SIZE: Final = 200_000  # Sized to hold a full snapshot's addresses
+MIN_RMP_FILE_SIZE: Final = 1000
+MIN_JSON_FILE_SIZE: Final = 1000
 
 
 # =============================================================================
@@ -30,13 +31,17 @@ MIN_JSON_FILE_SIZE = 1000
 # =============================================================================
 
 class DatabaseConfig:
-    MIN_POOL_SIZE = 5
-    MAX_POOL_SIZE = 20
-    COMMAND_TIMEOUT = 60
-    MAX_BATCH_SIZE = 100
-    INSERT_CHUNK_SIZE = 500
-    CLOSED_POSITION_MAX_AGE_HOURS = 24
-    STALE_POSITION_MAX_AGE_HOURS = 168
+    MIN_POOL_SIZE: Final = 5
+    MAX_POOL_SIZE: Final = 20
+    COMMAND_TIMEOUT: Final = 60
+    STATEMENT_CACHE_SIZE: Final = 64  # Default; set DB_STATEMENT_CACHE_SIZE=0 behind pgbouncer transaction pooling
+    MAX_INACTIVE_CONNECTION_LIFETIME: Final = 300
+    APPLICATION_NAME: Final = "anthias-monitor"
+    MAX_BATCH_SIZE: Final = 100
+    INSERT_CHUNK_SIZE: Final = 500
+    INSERT_COPY_CHUNK_SIZE: Final = 10_000
+    CLOSED_POSITION_MAX_AGE_HOURS: Final = 24
+    STALE_POSITION_MAX_AGE_HOURS: Final = 168
 
 
 # =============================================================================
@@ -44,13 +49,25 @@ class DatabaseConfig:
 # =============================================================================
 
 class APIConfig:
-    DEFAULT_HTTP_CONCURRENCY = 5
-    API_CALL_DELAY = 0.1
-    RETRY_BACKOFF_SEC = 0.5
-    POSITION_BATCH_SIZE = 500
-    BATCH_TIMEOUT = 30.0
-    BATCH_DELAY = 0.5
-    BATCH_ERROR_DELAY = 2.0
+    DEFAULT_HTTP_CONCURRENCY: Final = 5
+    MAX_INFLIGHT_PER_HOST: Final = 20
+    API_CALL_DELAY: Final = 0.1
+    RETRY_BACKOFF_SEC: Final = 0.5
+    POSITION_BATCH_SIZE: Final = 500
+    BATCH_TIMEOUT: Final = 30.0
+    BATCH_DELAY: Final = 0.5
+    BATCH_ERROR_DELAY: Final = 2.0
+    LOCAL_NODE_TIMEOUT: Final = 10.0
+    KEEPALIVE_TIMEOUT: Final = 30.0
+    DNS_CACHE_TTL: Final = 300
+
+
+class BatchConfig:
+    """Bounds for adaptive position refresh batch sizing (starts at position_refresh_batch_size)."""
+    MIN_SIZE: Final = 50
+    MAX_SIZE: Final = 2000
+    TARGET_BATCH_SECONDS: Final = 10.0
+    MAX_FAILURE_RATE: Final = 0.1
 
 
 # =============================================================================
@@ -58,12 +75,12 @@ class APIConfig:
 # =============================================================================
 
 class ProcessingIntervals:
-    SNAPSHOT_CHECK = 120
-    POSITION_REFRESH = 10
-    HEALTH_MONITOR = 30
-    STATS_REPORT = 300
-    CLEANUP = 3600
-    SNAPSHOT_COOLDOWN = 30
+    SNAPSHOT_CHECK: Final = 120
+    POSITION_REFRESH: Final = 10
+    HEALTH_MONITOR: Final = 30
+    STATS_REPORT: Final = 300
+    CLEANUP: Final = 3600
+    SNAPSHOT_COOLDOWN: Final = 30
 
 
 # =============================================================================
@@ -71,10 +88,14 @@ class ProcessingIntervals:
 # =============================================================================
 
 class FileConfig:
-    MAX_SNAPSHOT_CACHE_SIZE = 100
-    SNAPSHOT_RETENTION_COUNT = 2
-    FILE_READ_CHUNK_SIZE = 500 * 1024 * 1024
-    HASH_BLOCK_SIZE = 4096
+    MAX_SNAPSHOT_CACHE_SIZE: Final = 100
+    SNAPSHOT_RETENTION_COUNT: Final = 2
+    FILE_READ_CHUNK_SIZE: Final = 500 * 1024 * 1024
+    HASH_BLOCK_SIZE: Final = 4096
+    ADDRESS_SAVE_DEBOUNCE: Final = 1.0  # seconds
+    ADDRESS_SAVE_THRESHOLD: Final = 500  # pending address changes that trigger a save
+    ADDRESS_SAVE_MAX_DELAY: Final = 30.0  # seconds a smaller change set may wait
+    JOURNAL_COMPACT_RATIO: Final = 2  # journal entries per tracked address before a full rewrite
 
 
 # =============================================================================
@@ -82,10 +103,14 @@ class FileConfig:
 # =============================================================================
 
 class LogConfig:
-    MAX_LOG_SIZE = 10 * 1024 * 1024
-    MAX_ERROR_LOG_SIZE = 5 * 1024 * 1024
-    LOG_BACKUP_COUNT = 5
-    ERROR_LOG_BACKUP_COUNT = 3
+    MAX_LOG_SIZE: Final = 10 * 1024 * 1024
+    MAX_ERROR_LOG_SIZE: Final = 5 * 1024 * 1024
+    LOG_BACKUP_COUNT: Final = 5
+    ERROR_LOG_BACKUP_COUNT: Final = 3
+    LOG_BUFFER_SIZE: Final = 64 * 1024
+    LOG_FLUSH_INTERVAL: Final = 1.0  # seconds
+    ROLLOVER_CHECK_INTERVAL: Final = 100  # records between size checks
+    PROGRESS_LOG_INTERVAL: Final = 1.0  # seconds between batch progress logs
 
 
 # =============================================================================
@@ -93,19 +118,19 @@ class LogConfig:
 # =============================================================================
 
 class MonitoringThresholds:
-    MAX_CONSECUTIVE_ERRORS = 5
-    MAX_TASK_ERRORS = 10
-    MAX_DEGRADED_COMPONENTS = 2
-    CONVERSION_TIMEOUT = 300
-    SUBPROCESS_BUFFER_LIMIT = 1024 * 1024 * 10
-    SHUTDOWN_TIMEOUT = 10.0
+    MAX_CONSECUTIVE_ERRORS: Final = 5
+    MAX_TASK_ERRORS: Final = 10
+    MAX_DEGRADED_COMPONENTS: Final = 2
+    CONVERSION_TIMEOUT: Final = 300
+    SUBPROCESS_BUFFER_LIMIT: Final = 1024 * 1024 * 10
+    SHUTDOWN_TIMEOUT: Final = 10.0
 
 
 # =============================================================================
 # ENUMS
 # =============================================================================
 
-class SystemState(Enum):
+class SystemState(str, Enum):
     INITIALIZING = "initializing"
     READY = "ready"
     RUNNING = "running"
@@ -116,7 +141,7 @@ class SystemState(Enum):
     FATAL = "fatal"
 
 
-class ProcessingStatus(Enum):
+class ProcessingStatus(str, Enum):
     """Snapshot processing status."""
     PENDING = "pending"
     PROCESSING = "processing"
@@ -125,13 +150,13 @@ class ProcessingStatus(Enum):
     SKIPPED = "skipped"
 
 
-class APISource(Enum):
+class APISource(str, Enum):
     """API source enumeration."""
     NVN = "nvn"
     PUBLIC = "public"
 
 
-class LeverageType(Enum):
+class LeverageType(str, Enum):
     """Position leverage type."""
     CROSS = "cross"
     ISOLATED = "isolated"
@@ -143,5 +168,5 @@ class LeverageType(Enum):
 
 class ChainConfig:
     """Blockchain configuration."""
-    DEFAULT_CHAIN_TYPE = "Mainnet"
-    SUPPORTED_CHAINS = {"Mainnet", "Testnet"}
\ No newline at end of file
+    DEFAULT_CHAIN_TYPE: Final = "Mainnet"
+    SUPPORTED_CHAINS: Final = frozenset({"Mainnet", "Testnet"})
\ No newline at end of file
@@ -1,117 +1,237 @@
 """Logging configuration for Hyperliquid Position Monitoring System."""
+import atexit
+import copy
 import logging
 import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 from config.constants import LogConfig
 
+_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ('NOTSET', 'DEBUG', 'INFO', 'WARN', 'WARNING', 'ERROR', 'FATAL', 'CRITICAL')
+}
 
-class LoggingSetup:
 
-    @staticmethod
-    def setup_logging(log_dir: Path, log_level: str = "INFO", module_name: Optional[str] = None) -> logging.Logger:
-        log_dir.mkdir(parents=True, exist_ok=True)
-        logger = logging.getLogger(module_name) if module_name else logging.getLogger()
-        if logger.handlers:
-            return logger
-        logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+class FastFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second."""
 
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        simple_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ''
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_str
+
+
+_DETAILED_FMT = FastFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_SIMPLE_FMT = FastFormatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# (log_dir, module_name) pairs already configured, and the queue handler per log_dir
+_CONFIGURED: Set[Tuple[str, Optional[str]]] = set()
+_HANDLERS_CACHE: Dict[Path, logging.handlers.QueueHandler] = {}
+_CREATED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: Path):
+    key = os.fspath(path)
+    if key not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
+
+
+@lru_cache(maxsize=64)
+def _set_level(level: str, logger_name: Optional[str]):
+    # Repeated identical calls are no-ops; reset_level_cache() re-arms them
+    logging.getLogger(logger_name).setLevel(_LEVELS.get(level.upper(), logging.INFO))
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that writes through a large buffer.
+
+    The buffer is flushed on WARNING and above, by the periodic flusher started
+    in setup_logging, and on close. The size check for rollover flushes the
+    stream, so it only runs every ROLLOVER_CHECK_INTERVAL records.
+    """
+
+    def __init__(self, *args, buffer_size: int = LogConfig.LOG_BUFFER_SIZE, **kwargs):
+        self.buffer_size = buffer_size
+        self._records_since_check = 0
+        self._rollover_check_interval = LogConfig.ROLLOVER_CHECK_INTERVAL
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._records_since_check += 1
+            if self._records_since_check >= self._rollover_check_interval:
+                self._records_since_check = 0
+                if self.shouldRollover(record):
+                    self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock prepare() formats the whole record on the calling thread. Here only
+    the message args are merged, since they may change after the call returns;
+    timestamps, layout and tracebacks are formatted on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _start_flusher(handlers, interval: float):
+    """Flush buffered handlers every interval seconds on a daemon thread."""
+    stopped = threading.Event()
+
+    def run():
+        while not stopped.wait(interval):
+            for handler in handlers:
+                handler.flush()
 
-        all_logs_handler = logging.handlers.RotatingFileHandler(
+    threading.Thread(target=run, name="log-flusher", daemon=True).start()
+    atexit.register(stopped.set)
+
+
+def setup_logging(log_dir: Path, log_level: str = "INFO", module_name: Optional[str] = None) -> logging.Logger:
+    key = (str(log_dir), module_name)
+    logger = logging.getLogger(module_name) if module_name else logging.getLogger()
+    if key in _CONFIGURED or logger.handlers:
+        return logger
+    logger.setLevel(_LEVELS.get(log_level.upper(), logging.INFO))
+    _set_level.cache_clear()
+
+    # Skip per-record thread/process lookups; the caller frame is still needed for [file:line]
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
+    queue_handler = _HANDLERS_CACHE.get(log_dir)
+    if queue_handler is None:
+        _ensure_dir(log_dir)
+
+        all_logs_handler = BufferedRotatingFileHandler(
             log_dir / "monitor.log",
             maxBytes=LogConfig.MAX_LOG_SIZE,
             backupCount=LogConfig.LOG_BACKUP_COUNT,
             encoding='utf-8'
         )
         all_logs_handler.setLevel(logging.DEBUG)
-        all_logs_handler.setFormatter(detailed_formatter)
+        all_logs_handler.setFormatter(_DETAILED_FMT)
 
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = BufferedRotatingFileHandler(
             log_dir / "errors.log",
             maxBytes=LogConfig.MAX_ERROR_LOG_SIZE,
             backupCount=LogConfig.ERROR_LOG_BACKUP_COUNT,
             encoding='utf-8'
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(detailed_formatter)
+        error_handler.setFormatter(_DETAILED_FMT)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(simple_formatter)
+        console_handler.setFormatter(_SIMPLE_FMT)
 
-        logger.addHandler(all_logs_handler)
-        logger.addHandler(error_handler)
-        logger.addHandler(console_handler)
+        # Producers merge message args and enqueue; formatting and file I/O run on the listener thread
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, all_logs_handler, error_handler, console_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        _start_flusher((all_logs_handler, error_handler), LogConfig.LOG_FLUSH_INTERVAL)
 
-        logging.getLogger('asyncio').setLevel(logging.WARNING)
-        logging.getLogger('asyncpg').setLevel(logging.WARNING)
-        logging.getLogger('aiohttp').setLevel(logging.WARNING)
+        queue_handler = _HANDLERS_CACHE[log_dir] = _DeferredQueueHandler(log_queue)
 
-        return logger
+    logger.addHandler(queue_handler)
 
-    @staticmethod
-    def get_logger(name: str) -> logging.Logger:
-        return logging.getLogger(name)
-
-    @staticmethod
-    def set_level(level: str, logger_name: Optional[str] = None):
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-
-    @staticmethod
-    def add_file_handler(
-        logger: logging.Logger,
-        file_path: Path,
-        level: str = "DEBUG",
-        max_bytes: int = LogConfig.MAX_LOG_SIZE,
-        backup_count: int = LogConfig.LOG_BACKUP_COUNT
-    ):
-        """
-        Add an additional file handler to a logger.
-
-        Args:
-            logger: Logger instance
-            file_path: Path to log file
-            level: Log level for this handler
-            max_bytes: Maximum size before rotation
-            backup_count: Number of backup files to keep
-        """
-        file_handler = logging.handlers.RotatingFileHandler(
-            file_path,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(getattr(logging, level.upper(), logging.DEBUG))
+    logging.getLogger('asyncio').setLevel(logging.WARNING)
+    logging.getLogger('asyncpg').setLevel(logging.WARNING)
+    logging.getLogger('aiohttp').setLevel(logging.WARNING)
 
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(formatter)
+    _CONFIGURED.add(key)
+    return logger
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+def set_level(level: str, logger_name: Optional[str] = None):
+    _set_level(level, logger_name)
 
-        logger.addHandler(file_handler)
 
+def reset_level_cache():
+    """Forget applied levels so the next set_level call always takes effect."""
+    _set_level.cache_clear()
 
-# Convenience function for backward compatibility
-def setup_logging(log_dir: Path, log_level: str = "INFO") -> logging.Logger:
+
+def add_file_handler(
+    logger: logging.Logger,
+    file_path: Path,
+    level: str = "DEBUG",
+    max_bytes: int = LogConfig.MAX_LOG_SIZE,
+    backup_count: int = LogConfig.LOG_BACKUP_COUNT
+):
     """
-    Convenience wrapper for LoggingSetup.setup_logging().
+    Add an additional file handler to a logger.
 
     Args:
-        log_dir: Directory for log files
-        log_level: Logging level
-
-    Returns:
-        Configured root logger
+        logger: Logger instance
+        file_path: Path to log file
+        level: Log level for this handler
+        max_bytes: Maximum size before rotation
+        backup_count: Number of backup files to keep
     """
-    return LoggingSetup.setup_logging(log_dir, log_level)
\ No newline at end of file
+    file_handler = logging.handlers.RotatingFileHandler(
+        file_path,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(_LEVELS.get(level.upper(), logging.DEBUG))
+    file_handler.setFormatter(_DETAILED_FMT)
+
+    logger.addHandler(file_handler)
+
+
+# Backward-compatible alias: LoggingSetup.setup_logging(...) etc. resolve to the module functions
+LoggingSetup = sys.modules[__name__]
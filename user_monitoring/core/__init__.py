@@ -3,12 +3,14 @@
 from .snapshot_processor import SnapshotProcessor
 from .address_manager import AddressManager
 from .position_updater import PositionUpdater
-from .utils import is_ethereum_address, safe_float
+from .utils import is_ethereum_address, read_ethereum_addresses, safe_float, safe_int
 
 __all__ = [
     'SnapshotProcessor',
     'AddressManager',
     'PositionUpdater',
     'is_ethereum_address',
-    'safe_float'
+    'read_ethereum_addresses',
+    'safe_float',
+    'safe_int'
 ]
\ No newline at end of file
@@ -1,20 +1,45 @@
-"""Market-specific address manager with per-market file persistence."""
+"""Market-specific address manager with per-market file persistence.
+
+Each market is stored as a base address file plus a `.journal` of +/- changes
+made since the base was last written. Between compactions the base file alone
+is not the full state; the journal has to be replayed over it.
+"""
 import asyncio
 import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set, Dict, Optional, List, Tuple
+from typing import Collection, FrozenSet, Mapping, NamedTuple, Set, Dict, Optional, List, Tuple
 from datetime import datetime
 from threading import Lock
+from types import MappingProxyType
+
+from config.constants import FileConfig
+from core.utils import is_ethereum_address, read_ethereum_addresses
 
 logger = logging.getLogger(__name__)
 
+_JOURNAL_RE = re.compile(r'([+-])(0[xX][0-9a-fA-F]{40})')
+
+
+class _AddressViews(NamedTuple):
+    by_market: Mapping[str, FrozenSet[str]]
+    candidates: Mapping[str, FrozenSet[str]]
+    active: FrozenSet[str]
+    total_positions: int
+
+
+_EMPTY_VIEWS = _AddressViews(MappingProxyType({}), MappingProxyType({}), frozenset(), 0)
+
 
 class AddressManager:
 
     def __init__(self, config):
         self.config = config
         self.data_dir = config.data_dir
-        self.file_lock = asyncio.Lock()
+        self._file_locks: Dict[str, asyncio.Lock] = {}  # Per market, so markets save concurrently
         self.lock = Lock()  # Threading lock for thread-safe operations
 
         self.addresses_by_market: Dict[str, Set[str]] = {}
@@ -22,106 +47,269 @@ class AddressManager:
         self.last_snapshot_addresses: Dict[str, Set[str]] = {}
         self.active_addresses: Set[str] = set()
 
+        # Each market's set as last persisted (base file + journal), and journal length
+        self._persisted: Dict[str, FrozenSet[str]] = {}
+        self._journal_entries: Dict[str, int] = {}
+        self._pending_changes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="address-writer")
+        self._market_files: Dict[str, Path] = {}
+        self._stat_keys: Dict[str, Tuple[str, str]] = {}
+
+        # Copy-on-write snapshot for lock-free readers, and the sorted list built from it
+        self._views = _EMPTY_VIEWS
+        self._flat_cache: Optional[Tuple[_AddressViews, List[str]]] = None
+
         for market in config.target_markets:
             self.addresses_by_market[market] = set()
             self.removal_candidates[market] = set()
             self.last_snapshot_addresses[market] = set()
 
         self._load_all_market_addresses()
+        self._publish_views()
 
         logger.info(f"AddressManager initialized for markets: {', '.join(config.target_markets)}")
 
     def _is_valid_address(self, address: str) -> bool:
-        import re
         if not isinstance(address, str):
             return False
         if ':' in address:
-            address = address.split(':', 1)[1]
-        return bool(re.match(r'^0x[a-fA-F0-9]{40}$', address.strip()))
+            address = address.partition(':')[2]
+        return is_ethereum_address(address)
 
     def _get_market_file(self, market: str) -> Path:
         """Get the path for a market-specific address file."""
-        return self.data_dir / f"{market.lower()}_addresses.txt"
+        path = self._market_files.get(market)
+        if path is None:
+            path = self._market_files[market] = self.data_dir / f"{market.lower()}_addresses.txt"
+        return path
+
+    def _get_journal_file(self, market: str) -> Path:
+        """Get the path for a market's append-only change journal."""
+        return self._get_market_file(market).with_suffix('.journal')
 
     def _load_all_market_addresses(self):
         """Load addresses from all market-specific files."""
+        # One directory listing answers every per-market existence check
+        try:
+            existing = set(os.listdir(self.data_dir))
+        except FileNotFoundError:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            existing = set()
+
         for market in self.config.target_markets:
-            self._load_market_addresses(market)
+            self._load_market_addresses(market, existing)
 
-        self.active_addresses = set()
-        for addresses in self.addresses_by_market.values():
-            self.active_addresses.update(addresses)
+        self.active_addresses = set().union(*self.addresses_by_market.values())
+
+    def _load_market_addresses(self, market: str, existing: Set[str]):
+        """Load addresses for a specific market from its file, then replay its journal.
 
-    def _load_market_addresses(self, market: str):
-        """Load addresses for a specific market from its file."""
+        existing holds the file names present in the data directory.
+        """
         market_file = self._get_market_file(market)
 
-        if not market_file.exists():
+        if market_file.name not in existing:
             logger.info(f"No existing addresses file for {market}, will create when needed")
-            market_file.parent.mkdir(parents=True, exist_ok=True)
             return
 
         try:
-            addresses_loaded = 0
-            with open(market_file, 'r') as f:
-                for line in f:
-                    address = line.strip().lower()
-                    if address and self._is_valid_address(address):
-                        self.addresses_by_market[market].add(address)
-                        self.active_addresses.add(address)
-                        addresses_loaded += 1
-
-            if addresses_loaded > 0:
-                logger.info(f"Loaded {addresses_loaded} addresses for {market} from {market_file.name}")
+            # Interned so an address tracked in several markets is one shared string
+            addresses = set(map(sys.intern, read_ethereum_addresses(market_file)))
+
+            entries = 0
+            skipped = 0
+            journal_file = self._get_journal_file(market)
+            if journal_file.name in existing:
+                with open(journal_file, 'r') as f:
+                    for line in f.read().splitlines():
+                        line = line.strip()
+                        if not line:
+                            continue
+                        match = _JOURNAL_RE.fullmatch(line)
+                        if match is None:
+                            skipped += 1
+                            continue
+                        op, address = match.groups()
+                        address = address.lower()
+                        if op == '+':
+                            addresses.add(sys.intern(address))
+                        else:
+                            addresses.discard(address)
+                        entries += 1
+                if skipped:
+                    logger.warning(f"Skipped {skipped} malformed lines in {journal_file.name}")
+
+            self.addresses_by_market[market].update(addresses)
+            self.active_addresses.update(addresses)
+            self._persisted[market] = frozenset(addresses)
+            self._journal_entries[market] = entries
+
+            if addresses:
+                logger.info(f"Loaded {len(addresses)} addresses for {market} from {market_file.name}"
+                            f" ({entries} journal entries)")
         except Exception as e:
             logger.error(f"Error loading addresses for {market}: {e}")
 
     async def save_market_addresses(self, market: str):
-        """Save addresses for a specific market to its file."""
+        """
+        Save addresses for a specific market.
+
+        Changes since the last save are appended to the market's journal; once
+        the journal outgrows JOURNAL_COMPACT_RATIO times the set, the full file
+        is rewritten and the journal dropped.
+        """
         market_file = self._get_market_file(market)
+        journal_file = self._get_journal_file(market)
+
+        lock = self._file_locks.get(market)
+        if lock is None:
+            lock = self._file_locks[market] = asyncio.Lock()
 
-        async with self.file_lock:
+        async with lock:
             try:
-                # Ensure directory exists
-                market_file.parent.mkdir(parents=True, exist_ok=True)
-
-                tmp_path = Path(str(market_file) + '.tmp')
-                with open(tmp_path, 'w') as f:
-                    f.write(f"# {market} addresses\n")
-                    f.write(f"# Generated: {datetime.now().isoformat()}\n")
-                    f.write(f"# Count: {len(self.addresses_by_market.get(market, set()))}\n\n")
-                    for address in sorted(self.addresses_by_market.get(market, set())):
-                        f.write(f"{address}\n")
-                tmp_path.replace(market_file)
-
-                logger.debug(f"Saved {len(self.addresses_by_market.get(market, set()))} addresses for {market}")
+                # The published views re-freeze only markets that changed, so an
+                # untouched market's frozenset is the very object last persisted
+                snapshot = self._views.by_market.get(market, frozenset())
+                persisted = self._persisted.get(market)
+                if snapshot is persisted:
+                    return True
+                has_base = market_file.exists()
+                if snapshot == persisted and has_base:
+                    self._persisted[market] = snapshot
+                    logger.debug(f"Addresses for {market} unchanged, skipping save")
+                    return True
+
+                # Sorting and disk I/O run on the single writer thread, off the event loop
+                loop = asyncio.get_running_loop()
+                if persisted is not None and has_base:
+                    added = snapshot - persisted
+                    removed = persisted - snapshot
+                    entries = self._journal_entries.get(market, 0) + len(added) + len(removed)
+                    if entries <= FileConfig.JOURNAL_COMPACT_RATIO * max(len(snapshot), 1):
+                        await loop.run_in_executor(
+                            self._io_executor, self._append_journal, journal_file, added, removed
+                        )
+                        self._persisted[market] = snapshot
+                        self._journal_entries[market] = entries
+                        logger.debug(f"Journaled +{len(added)}/-{len(removed)} addresses for {market}")
+                        return True
+
+                await loop.run_in_executor(
+                    self._io_executor, self._compact_market_file, market, market_file, journal_file, snapshot
+                )
+                self._persisted[market] = snapshot
+                self._journal_entries[market] = 0
+
+                logger.debug(f"Saved {len(snapshot)} addresses for {market}")
                 return True
             except Exception as e:
                 logger.error(f"Error saving addresses for {market}: {e}")
-                if tmp_path.exists():
-                    tmp_path.unlink()
                 return False
 
+    @staticmethod
+    def _append_journal(journal_file: Path, added: FrozenSet[str], removed: FrozenSet[str]):
+        entries = [f"+{address}\n" for address in added]
+        entries.extend(f"-{address}\n" for address in removed)
+        with open(journal_file, 'a') as f:
+            f.write(''.join(entries))
+
+    @classmethod
+    def _compact_market_file(cls, market: str, market_file: Path, journal_file: Path, snapshot: FrozenSet[str]):
+        # The base file is replaced before the journal goes, and replaying a stale
+        # journal over the new base yields the same set, so a crash in between is safe
+        cls._write_market_file(market, market_file, snapshot)
+        try:
+            os.unlink(journal_file)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _write_market_file(market: str, market_file: Path, snapshot: FrozenSet[str]):
+        path = os.fspath(market_file)
+        tmp_path = path + '.tmp'
+
+        addresses = sorted(snapshot)
+        header = (
+            f"# {market} addresses\n"
+            f"# Generated: {datetime.now().isoformat()}\n"
+            f"# Count: {len(addresses)}\n\n"
+        )
+        buf = (header + ''.join(f"{address}\n" for address in addresses)).encode()
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(tmp_path, flags, 0o644)
+        except FileNotFoundError:
+            market_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, flags, 0o644)
+        try:
+            # One write of the assembled file instead of a write per address
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+        except Exception:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+
     async def save_all_market_addresses(self):
-        """Save all market addresses to their respective files."""
-        for market in self.addresses_by_market:
-            await self.save_market_addresses(market)
+        """Save all market addresses to their respective files, concurrently across markets."""
+        await asyncio.gather(*(self.save_market_addresses(market) for market in list(self.addresses_by_market)))
 
-    def _save_to_file_sync(self):
+    def request_save(self, changes: int):
+        """
+        Schedule a save of all market files.
+
+        Changes accumulate and are written once ADDRESS_SAVE_THRESHOLD of them are
+        pending, or ADDRESS_SAVE_MAX_DELAY seconds after the first one, checking
+        every ADDRESS_SAVE_DEBOUNCE seconds.
+        """
+        if changes <= 0:
+            return
+        self._pending_changes += changes
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self.save_all_market_addresses())
-            else:
-                loop.run_until_complete(self.save_all_market_addresses())
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            asyncio.run(self.save_all_market_addresses())
+            asyncio.run(self.flush())
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        loop = asyncio.get_running_loop()
+        first_change = loop.time()
+        while self._pending_changes:
+            await asyncio.sleep(FileConfig.ADDRESS_SAVE_DEBOUNCE)
+            if (self._pending_changes < FileConfig.ADDRESS_SAVE_THRESHOLD
+                    and loop.time() - first_change < FileConfig.ADDRESS_SAVE_MAX_DELAY):
+                continue
+            self._pending_changes = 0
+            await self.save_all_market_addresses()
+            first_change = loop.time()
+
+    async def flush(self):
+        """Write any pending address changes immediately."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._pending_changes = 0
+        await self.save_all_market_addresses()
 
     def update_from_snapshot(self, snapshot_addresses: Dict[str, Set[str]]) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """
+        Merge a snapshot's addresses and mark addresses that left it as removal candidates.
+
+        The snapshot sets are kept (not copied) as the baseline for the next call,
+        so callers must not mutate them afterwards.
+        """
 
         with self.lock:
             new_addresses = {market: set() for market in self.config.target_markets}
             new_removal_candidates = {market: set() for market in self.config.target_markets}
+            changed = []
+            candidates_changed = []
 
             for market in self.config.target_markets:
                 current_snapshot = snapshot_addresses.get(market, set())
@@ -130,26 +318,29 @@ class AddressManager:
 
                 new = current_snapshot - current_active
                 if new:
+                    new = set(map(sys.intern, new))
                     new_addresses[market] = new
                     self.addresses_by_market[market].update(new)
+                    self.active_addresses.update(new)
+                    changed.append(market)
                     logger.info(f"Added {len(new)} new {market} addresses")
 
                 if previous_snapshot:
-                    disappeared = previous_snapshot - current_snapshot
-                    candidates = disappeared & current_active
+                    # Addresses that left the snapshot but are still tracked
+                    candidates = previous_snapshot - current_snapshot
+                    candidates &= current_active
 
                     if candidates:
                         new_removal_candidates[market] = candidates
                         self.removal_candidates[market].update(candidates)
+                        candidates_changed.append(market)
                         logger.info(f"Marked {len(candidates)} {market} addresses as removal candidates")
 
-                self.last_snapshot_addresses[market] = current_snapshot.copy()
+                self.last_snapshot_addresses[market] = current_snapshot
 
-            self.active_addresses = set()
-            for addresses in self.addresses_by_market.values():
-                self.active_addresses.update(addresses)
-            if any(new_addresses.values()):
-                self._save_to_file_sync()
+            if changed or candidates_changed:
+                self._publish_views(changed, candidates_changed)
+            self.request_save(sum(len(new) for new in new_addresses.values()))
 
             return new_addresses, new_removal_candidates
 
@@ -157,6 +348,8 @@ class AddressManager:
 
         with self.lock:
             total_removed = 0
+            removed_total = set()
+            changed = []
 
             for market, closed_addrs in closed_positions.items():
                 # Only remove if in removal candidates (dual-check)
@@ -165,14 +358,25 @@ class AddressManager:
                 if to_remove:
                     self.addresses_by_market[market] -= to_remove
                     self.removal_candidates[market] -= to_remove
-                    self.active_addresses -= to_remove
+                    removed_total |= to_remove
                     total_removed += len(to_remove)
+                    changed.append(market)
 
                     logger.info(f"Removed {len(to_remove)} {market} addresses (dual-check confirmed)")
 
+            self._discard_untracked(removed_total)
+
             if total_removed > 0:
+                self._publish_views(changed, changed)
                 # Save to market files after removals
-                await self.save_all_market_addresses()
+                self.request_save(total_removed)
+
+    def _discard_untracked(self, removed: Set[str]):
+        """Drop removed addresses from active_addresses unless another market still tracks them."""
+        markets = self.addresses_by_market.values()
+        for address in removed:
+            if not any(address in addresses for addresses in markets):
+                self.active_addresses.discard(address)
 
     async def sync_with_database(self, db_addresses_by_market: Dict[str, Set[str]]) -> Dict[str, Dict[str, Set[str]]]:
         """
@@ -191,6 +395,11 @@ class AddressManager:
                 file_addresses = self.addresses_by_market.get(market, set())
                 db_addresses = db_addresses_by_market.get(market, set())
 
+                # In-sync markets (the common case) cost one allocation-free
+                # comparison, which bails out on a size mismatch, instead of two diffs
+                if file_addresses == db_addresses:
+                    continue
+
                 # Addresses in file but not in DB (need to add to DB)
                 to_add = file_addresses - db_addresses
                 if to_add:
@@ -205,7 +414,39 @@ class AddressManager:
 
         return sync_actions
 
-    def get_addresses(self, market: Optional[str] = None) -> Dict[str, Set[str]]:
+    def _publish_views(self, markets: Optional[Collection[str]] = None,
+                       candidate_markets: Optional[Collection[str]] = None):
+        """Publish immutable copies of the address sets; call under self.lock after any mutation.
+
+        Readers load self._views once and never take the lock; the attribute
+        swap is atomic, so they see either the old or the new snapshot. Only the
+        markets whose addresses or candidates changed are re-frozen (None means
+        all of them); untouched markets share their frozensets with the old views.
+        """
+        views = self._views
+        if markets is None:
+            by_market = {m: frozenset(a) for m, a in self.addresses_by_market.items()}
+        else:
+            by_market = dict(views.by_market)
+            for m in markets:
+                by_market[m] = frozenset(self.addresses_by_market[m])
+        if candidate_markets is None:
+            candidates = {m: frozenset(a) for m, a in self.removal_candidates.items()}
+        else:
+            candidates = dict(views.candidates)
+            for m in candidate_markets:
+                candidates[m] = frozenset(self.removal_candidates[m])
+
+        address_changed = markets is None or bool(markets)
+        self._views = _AddressViews(
+            by_market=MappingProxyType(by_market),
+            candidates=MappingProxyType(candidates),
+            active=frozenset(self.active_addresses) if address_changed else views.active,
+            total_positions=(sum(len(a) for a in self.addresses_by_market.values())
+                             if address_changed else views.total_positions),
+        )
+
+    def get_addresses(self, market: Optional[str] = None) -> Dict[str, FrozenSet[str]]:
         """
         Get active addresses.
 
@@ -215,62 +456,61 @@ class AddressManager:
         Returns:
             Dictionary of market -> addresses
         """
+        views = self._views
+        if market:
+            return {market: views.by_market.get(market, frozenset())}
+        else:
+            return dict(views.by_market)
 
-        with self.lock:
-            if market:
-                return {market: self.addresses_by_market.get(market, set()).copy()}
-            else:
-                return {m: addrs.copy() for m, addrs in self.addresses_by_market.items()}
-
-    def get_market_addresses(self, market: str) -> Set[str]:
+    def get_market_addresses(self, market: str) -> FrozenSet[str]:
         """Get addresses for a specific market."""
-        with self.lock:
-            return self.addresses_by_market.get(market, set()).copy()
+        return self._views.by_market.get(market, frozenset())
 
-    def get_all_addresses(self) -> Set[str]:
+    def get_all_addresses(self) -> FrozenSet[str]:
         """Get all unique addresses across all markets."""
-        with self.lock:
-            return self.active_addresses.copy()
+        return self._views.active
 
-    def get_addresses_by_market(self) -> Dict[str, Set[str]]:
+    def get_addresses_by_market(self) -> Dict[str, FrozenSet[str]]:
         """Get all addresses grouped by market."""
-        with self.lock:
-            return {market: addrs.copy() for market, addrs in self.addresses_by_market.items()}
+        return dict(self._views.by_market)
 
-    def get_removal_candidates(self, market: Optional[str] = None) -> Dict[str, Set[str]]:
+    def get_removal_candidates(self, market: Optional[str] = None) -> Dict[str, FrozenSet[str]]:
         """Get addresses marked for potential removal."""
-
-        with self.lock:
-            if market:
-                return {market: self.removal_candidates.get(market, set()).copy()}
-            else:
-                return {m: addrs.copy() for m, addrs in self.removal_candidates.items()}
+        views = self._views
+        if market:
+            return {market: views.candidates.get(market, frozenset())}
+        else:
+            return dict(views.candidates)
 
     def get_all_addresses_flat(self) -> List[str]:
         """Get all addresses as a sorted flat list (for sequential API calls)."""
-
-        with self.lock:
-            return sorted(list(self.active_addresses))
+        views = self._views
+        cached = self._flat_cache
+        if cached is None or cached[0] is not views:
+            cached = self._flat_cache = (views, sorted(views.active))
+        return list(cached[1])
 
     def get_address_count(self) -> int:
         """Get total count of unique addresses being tracked."""
-        with self.lock:
-            return len(self.active_addresses)
+        return len(self._views.active)
 
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about managed addresses."""
+        views = self._views
+        stats = {
+            'total_unique': len(views.active),
+            'total_positions': views.total_positions,
+        }
 
-        with self.lock:
-            stats = {
-                'total_unique': len(self.active_addresses),
-                'total_positions': sum(len(addrs) for addrs in self.addresses_by_market.values()),
-            }
-
-            for market in self.config.target_markets:
-                stats[f'{market.lower()}_addresses'] = len(self.addresses_by_market.get(market, set()))
-                stats[f'{market.lower()}_removal_candidates'] = len(self.removal_candidates.get(market, set()))
+        for market in self.config.target_markets:
+            keys = self._stat_keys.get(market)
+            if keys is None:
+                token = market.lower()
+                keys = self._stat_keys[market] = (f'{token}_addresses', f'{token}_removal_candidates')
+            stats[keys[0]] = len(views.by_market.get(market, ()))
+            stats[keys[1]] = len(views.candidates.get(market, ()))
 
-            return stats
+        return stats
 
     async def update_addresses(self, addresses_by_market: Dict[str, Set[str]]) -> int:
         """
@@ -283,6 +523,7 @@ class AddressManager:
             Total number of new addresses added
         """
         total_new = 0
+        changed = []
 
         with self.lock:
             for market, addresses in addresses_by_market.items():
@@ -293,13 +534,17 @@ class AddressManager:
                 new_addresses = addresses - self.addresses_by_market[market]
 
                 if new_addresses:
+                    new_addresses = set(map(sys.intern, new_addresses))
                     self.addresses_by_market[market].update(new_addresses)
                     self.active_addresses.update(new_addresses)
                     total_new += len(new_addresses)
+                    changed.append(market)
                     logger.info(f"Added {len(new_addresses)} new addresses for {market}")
 
-        if total_new > 0:
-            await self.save_all_market_addresses()
+            if total_new > 0:
+                self._publish_views(changed, ())
+
+        self.request_save(total_new)
 
         return total_new
 
@@ -317,6 +562,7 @@ class AddressManager:
 
         with self.lock:
             stats = {'added': 0, 'removed': 0, 'total': 0}
+            removed_total = set()
 
             # Calculate what's being added and removed
             for market, new_addresses in addresses_by_market.items():
@@ -337,24 +583,28 @@ class AddressManager:
                 if removed:
                     logger.info(f"{market}: Removing {len(removed)} addresses without positions")
 
-                # Replace with new set
-                self.addresses_by_market[market] = new_addresses.copy()
+                # Apply the delta in place rather than copying the whole new set
+                if removed:
+                    old_addresses -= removed
+                    removed_total |= removed
+                if added:
+                    added = set(map(sys.intern, added))
+                    old_addresses |= added
+                    self.active_addresses |= added
 
-            # Rebuild general active addresses set from all markets
-            self.active_addresses = set()
-            for addresses in self.addresses_by_market.values():
-                self.active_addresses.update(addresses)
+            self._discard_untracked(removed_total)
 
             stats['total'] = len(self.active_addresses)
 
             # Clear removal candidates since we've done a full replacement
             for market in self.removal_candidates:
                 self.removal_candidates[market].clear()
+            self._publish_views()
 
             logger.info(f"Address replacement complete: {stats['total']} total addresses "
                        f"(+{stats['added']}/-{stats['removed']})")
 
-        # Save to files
-        await self.save_all_market_addresses()
+        # Save to files (skipped per market when unchanged)
+        self.request_save(stats['added'] + stats['removed'])
 
         return stats
\ No newline at end of file
@@ -2,14 +2,38 @@
 import asyncio
 import aiohttp
 import logging
+import time
+from collections import Counter
+from itertools import chain
 from typing import Dict, List, Optional, Set, Any
 from datetime import datetime
 
-from config.constants import APISource, APIConfig
-from core.utils import safe_float
+from config.constants import APISource, APIConfig, BatchConfig, LogConfig
+from core.utils import safe_float, safe_int
 
 logger = logging.getLogger(__name__)
 
+_LOCAL_NODE_TIMEOUT = aiohttp.ClientTimeout(total=APIConfig.LOCAL_NODE_TIMEOUT)
+
+
+def _next_batch_size(current: int, elapsed: float, failure_rate: float) -> int:
+    """Halve the batch after a slow or failing batch, grow it by a quarter after a fast one."""
+    if elapsed > BatchConfig.TARGET_BATCH_SECONDS or failure_rate > BatchConfig.MAX_FAILURE_RATE:
+        current //= 2
+    elif elapsed < BatchConfig.TARGET_BATCH_SECONDS / 2:
+        current += current // 4
+    return max(BatchConfig.MIN_SIZE, min(current, BatchConfig.MAX_SIZE))
+
+
+class _InflightFetch:
+    """A clearinghouseState fetch shared by concurrent requesters, and how many are awaiting it."""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
 
 class PositionUpdater:
 
@@ -18,20 +42,43 @@ class PositionUpdater:
         self.db = db_manager
         self.session: Optional[aiohttp.ClientSession] = None
 
-        self._sem = asyncio.Semaphore(getattr(self.config, 'max_workers', APIConfig.DEFAULT_HTTP_CONCURRENCY))
+        # In-flight request caps per backend, each within the connector's per-host limit
+        nvn_concurrency = min(getattr(self.config, 'max_workers', APIConfig.DEFAULT_HTTP_CONCURRENCY),
+                              APIConfig.MAX_INFLIGHT_PER_HOST)
+        self._sems = {
+            APISource.NVN: asyncio.Semaphore(nvn_concurrency),
+            APISource.PUBLIC: asyncio.Semaphore(APIConfig.DEFAULT_HTTP_CONCURRENCY),
+        }
+        self._local_sem = asyncio.Semaphore(APIConfig.MAX_INFLIGHT_PER_HOST)
         self._retry_backoff = getattr(self.config, 'retry_delay', APIConfig.RETRY_BACKOFF_SEC)
         self._api_call_delay = APIConfig.API_CALL_DELAY
+
+        # Per update_positions call: an address tracked in several markets is fetched once,
+        # and its state is kept only until the last of those markets has used it
+        self._state_cache: Dict[str, Dict] = {}
+        self._state_uses: Dict[str, int] = {}
+        # address -> fetch in progress, shared by concurrent requesters of the same address
+        self._inflight: Dict[str, _InflightFetch] = {}
+
         self.api_stats = {
             'nvn_success': 0,
             'nvn_failures': 0,
             'public_success': 0,
             'public_failures': 0,
-            'total_queries': 0
+            'total_queries': 0,
+            'cache_hits': 0,
+            'cache_misses': 0
         }
 
     async def start(self):
         timeout = aiohttp.ClientTimeout(total=self.config.api_timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # One keep-alive pool shared by every API and local node request
+        connector = aiohttp.TCPConnector(
+            limit_per_host=APIConfig.MAX_INFLIGHT_PER_HOST,
+            keepalive_timeout=APIConfig.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=APIConfig.DNS_CACHE_TTL,  # The few API hosts rarely move; aiohttp's default is 10s
+        )
+        self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         logger.info("Position updater started")
 
     async def stop(self):
@@ -47,11 +94,11 @@ class PositionUpdater:
             logger.info("No addresses to update")
             return {}
 
-        total_unique_addresses = set()
-        for addresses in addresses_by_market.values():
-            total_unique_addresses.update(addresses)
+        uses = Counter(chain.from_iterable(addresses_by_market.values()))
+        self._state_uses = {address: count for address, count in uses.items() if count > 1}
+        self._state_cache.clear()
 
-        total_addresses = len(total_unique_addresses)
+        total_addresses = len(uses)
         total_markets = len(addresses_by_market)
 
         logger.info("=" * 80)
@@ -178,6 +225,8 @@ class PositionUpdater:
         logger.info(f"❌ API failures: {overall_stats['total_api_failures']}")
         logger.info(f"📊 Total positions found: {overall_stats['total_positions_found']}")
 
+        self._state_uses.clear()
+        self._state_cache.clear()
         return all_positions
 
     async def _process_market_addresses(self, market: str, addresses: List[str]) -> tuple[Dict[str, Dict], Dict[str, int]]:
@@ -194,7 +243,7 @@ class PositionUpdater:
 
         market_positions = {}
         batch_size = self.config.position_refresh_batch_size
-        total_batches = (len(addresses) + batch_size - 1) // batch_size
+        total_addresses = len(addresses)
 
         # Counters for this market
         successful_addresses = 0
@@ -202,13 +251,27 @@ class PositionUpdater:
         no_positions = 0
         positions_found = 0
 
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(addresses))
+        batch_num = 0
+        end_idx = 0
+        # The previous batch's DB write runs while the next batch's API calls are in flight
+        pending_store: Optional[asyncio.Task] = None
+        # Per-address lines are only built when DEBUG is on; batch progress is throttled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        last_progress_log = float('-inf')
+        while end_idx < total_addresses:
+            start_idx = end_idx
+            end_idx = min(start_idx + batch_size, total_addresses)
             batch_addresses = addresses[start_idx:end_idx]
-
-            logger.info(f"  🔄 {market} batch {batch_num + 1}/{total_batches} ({len(batch_addresses)} addresses)")
-            logger.debug(f"    📋 Batch {batch_num + 1} addresses: {start_idx}-{end_idx-1}")
+            batch_num += 1
+            batch_failures_before = api_failures
+            batch_started = time.perf_counter()
+            log_progress = (end_idx >= total_addresses
+                            or time.monotonic() - last_progress_log >= LogConfig.PROGRESS_LOG_INTERVAL)
+            if log_progress:
+                last_progress_log = time.monotonic()
+                logger.info(f"  🔄 {market} batch {batch_num} ({end_idx}/{total_addresses} addresses, batch size {len(batch_addresses)})")
+            if debug_enabled:
+                logger.debug(f"    📋 Batch {batch_num} addresses: {start_idx}-{end_idx-1}")
 
             try:
                 # Create address to markets mapping for this specific market
@@ -220,41 +283,55 @@ class PositionUpdater:
                 for address, positions in batch_results.items():
                     if positions is None:
                         api_failures += 1
-                        logger.debug(f"    ❌ {address}: API failure")
+                        if debug_enabled:
+                            logger.debug(f"    ❌ {address}: API failure")
                     elif len(positions) == 0:
                         no_positions += 1
-                        logger.debug(f"    ⚪ {address}: No positions in {market}")
+                        if debug_enabled:
+                            logger.debug(f"    ⚪ {address}: No positions in {market}")
                     else:
                         market_positions[address] = positions
                         positions_count = len(positions)
                         positions_found += positions_count
                         successful_addresses += 1
-                        logger.debug(f"    ✓ {address}: {positions_count} positions")
+                        if debug_enabled:
+                            logger.debug(f"    ✓ {address}: {positions_count} positions")
 
-                # Store batch results - pass ALL batch addresses for proper cleanup
+                # Store batch results - pass ALL batch addresses for proper cleanup.
+                # Writes stay ordered: at most one is in flight, awaited before the next starts
+                if pending_store is not None:
+                    await pending_store
                 logger.debug(f"    💾 Storing {len(batch_results)} address results to database...")
-                await self._store_positions(batch_results, market, batch_addresses)
-
-                # Ensure database write is fully committed before continuing
-                await asyncio.sleep(0.2)  # Longer delay to ensure write completion
-                logger.debug(f"    ✅ Database write completed")
+                pending_store = asyncio.create_task(
+                    self._store_positions(batch_results, market, batch_addresses, log_details=log_progress)
+                )
 
                 # Progress update for this market
-                total_processed = successful_addresses + api_failures + no_positions
-                success_rate = (successful_addresses / total_processed) * 100 if total_processed > 0 else 0
-                logger.info(f"    Batch {batch_num + 1} complete: {successful_addresses} with positions, "
-                           f"{no_positions} no positions, {api_failures} API failures ({success_rate:.1f}% found positions)")
+                if log_progress:
+                    total_processed = successful_addresses + api_failures + no_positions
+                    success_rate = (successful_addresses / total_processed) * 100 if total_processed > 0 else 0
+                    logger.info(f"    Batch {batch_num} complete: {successful_addresses} with positions, "
+                               f"{no_positions} no positions, {api_failures} API failures ({success_rate:.1f}% found positions)")
+
+                failure_rate = (api_failures - batch_failures_before) / len(batch_addresses)
+                batch_size = _next_batch_size(batch_size, time.perf_counter() - batch_started, failure_rate)
 
                 # Rate limiting between batches
                 await asyncio.sleep(APIConfig.BATCH_DELAY)
 
             except Exception as e:
-                logger.error(f"    ❌ FAILED to process {market} batch {batch_num + 1}/{total_batches}: {e}")
+                logger.error(f"    ❌ FAILED to process {market} batch {batch_num} ({start_idx}-{end_idx-1}): {e}")
                 logger.error(f"    ⏭️  Skipping {len(batch_addresses)} addresses and continuing to next batch...")
                 api_failures += len(batch_addresses)
+                batch_size = _next_batch_size(batch_size, float('inf'), 1.0)
                 await asyncio.sleep(APIConfig.BATCH_ERROR_DELAY)
                 continue
 
+        # The caller verifies DB counts next, so the last write must be committed
+        if pending_store is not None:
+            await pending_store
+            logger.debug(f"    ✅ Database writes completed for {market}")
+
         market_stats = {
             'successful': successful_addresses,
             'failures': api_failures,
@@ -336,24 +413,76 @@ class PositionUpdater:
             logger.error(f"Error getting positions for {address}: {e}")
             return None
 
+    def _consume_state(self, address: str, state: Optional[Dict]):
+        """Record one market's use of an address's state, keeping it only while another market still needs it."""
+        remaining = self._state_uses.get(address)
+        if remaining is None:
+            return
+        if remaining > 1:
+            self._state_uses[address] = remaining - 1
+            if state:
+                self._state_cache[address] = state
+        else:
+            del self._state_uses[address]
+            self._state_cache.pop(address, None)
+
+    def invalidate_state(self, address: str):
+        """Forget the cached clearinghouseState of an address known to have changed."""
+        self._state_cache.pop(address, None)
+
+    async def _query_state(self, address: str) -> Optional[Dict]:
+        """Query clearinghouseState from NVN first, falling back to the public API."""
+        state = await self._query_clearinghouse_state(address, APISource.NVN)
+        if not state:
+            state = await self._query_clearinghouse_state(address, APISource.PUBLIC)
+        return state
+
+    async def _fetch_state(self, address: str) -> Optional[Dict]:
+        """Fetch an address's state, joining a fetch already in flight for it instead of issuing another."""
+        fetch = self._inflight.get(address)
+        if fetch is None:
+            fetch = self._inflight[address] = _InflightFetch(asyncio.ensure_future(self._query_state(address)))
+        fetch.waiters += 1
+        try:
+            # Shielded so a cancelled requester (e.g. a batch timeout) doesn't cancel it for the others
+            return await asyncio.shield(fetch.task)
+        finally:
+            fetch.waiters -= 1
+            if not fetch.waiters:
+                # Nobody is left to use the result, so a fetch still running is cancelled
+                # rather than holding a semaphore slot through its retries
+                del self._inflight[address]
+                fetch.task.cancel()
+
     async def _get_user_positions(
         self,
         address: str,
-        target_markets: List[str]
+        target_markets: List[str],
+        use_cache: bool = True
     ) -> Optional[Dict[str, Any]]:
-        """Get positions for a single user via API."""
+        """Get positions for a single user via API, reusing a state another market fetched this cycle.
 
-        try:
-            # Try NVN first, fallback to public
-            state = await self._query_clearinghouse_state(address, APISource.NVN)
-            if not state:
-                state = await self._query_clearinghouse_state(address, APISource.PUBLIC)
-
-            if not state:
-                logger.debug(f"No clearinghouse state for {address}")
-                return None
-        except Exception as e:
-            logger.error(f"Failed to get positions for {address}: {e}")
+        With use_cache=False the state is always fetched and is not stored.
+        Returns None if the state could not be fetched, and {} if it has no
+        positions in target_markets.
+        """
+
+        state = self._state_cache.get(address) if use_cache else None
+        if state is not None:
+            self.api_stats['cache_hits'] += 1
+        else:
+            self.api_stats['cache_misses'] += 1
+            try:
+                state = await self._fetch_state(address)
+
+                if not state:
+                    logger.debug(f"No clearinghouse state for {address}")
+            except Exception as e:
+                logger.error(f"Failed to get positions for {address}: {e}")
+                state = None
+        if use_cache:
+            self._consume_state(address, state)
+        if not state:
             return None
 
         # Extract positions for target markets
@@ -364,6 +493,13 @@ class PositionUpdater:
         asset_positions = state.get('assetPositions', [])
         margin_summary = state.get('marginSummary', {})
 
+        # Loop invariants: set membership for the market filter, account-level fields parsed once
+        target_set = frozenset(target_markets)
+        min_position_size_usd = self.config.min_position_size_usd
+        account_value = safe_float(margin_summary.get('accountValue'))
+        total_margin_used = safe_float(margin_summary.get('totalMarginUsed'))
+        withdrawable = safe_float(state.get('withdrawable'))  # Top-level field
+
         for asset_pos in asset_positions:
             position = asset_pos.get('position', {})
             coin = position.get('coin', '').upper()
@@ -371,7 +507,7 @@ class PositionUpdater:
             processed_count += 1
 
             # Skip if not in target markets
-            if coin not in target_markets:
+            if coin not in target_set:
                 continue
 
             # Extract size - this is a STRING in the API response
@@ -391,9 +527,9 @@ class PositionUpdater:
             margin_used = safe_float(position.get('marginUsed'))
 
             # Check minimum threshold - but be more lenient to avoid losing positions
-            if position_value_usd and position_value_usd < self.config.min_position_size_usd:
+            if position_value_usd and position_value_usd < min_position_size_usd:
                 filtered_count += 1
-                logger.debug(f"Filtering out {coin} position: ${position_value_usd:.2f} < ${self.config.min_position_size_usd}")
+                logger.debug(f"Filtering out {coin} position: ${position_value_usd:.2f} < ${min_position_size_usd}")
                 continue
 
             # Get leverage info - it's a nested dict
@@ -419,9 +555,9 @@ class PositionUpdater:
                     'value': leverage_value,
                     'rawUsd': leverage_raw_usd
                 },
-                'account_value': safe_float(margin_summary.get('accountValue')),
-                'total_margin_used': safe_float(margin_summary.get('totalMarginUsed')),
-                'withdrawable': safe_float(state.get('withdrawable'))  # Top-level field
+                'account_value': account_value,
+                'total_margin_used': total_margin_used,
+                'withdrawable': withdrawable
             }
 
         # Log processing stats to identify the gap
@@ -498,18 +634,18 @@ class PositionUpdater:
         try:
             # Try local node info server first (if available)
             if hasattr(self.config, 'local_node_url'):
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    payload = {"type": "activeAssetData"}
-                    async with session.post(f"{self.config.local_node_url}/info", json=payload) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            mark_prices = {}
-                            for asset_data in data:
-                                coin = asset_data.get('coin', '').upper()
-                                mark_px = float(asset_data.get('markPx', 0))
-                                if coin and mark_px > 0:
-                                    mark_prices[coin] = mark_px
-                            return mark_prices
+                payload = {"type": "activeAssetData"}
+                async with self.session.post(f"{self.config.local_node_url}/info", json=payload,
+                                             timeout=_LOCAL_NODE_TIMEOUT) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        mark_prices = {}
+                        for asset_data in data:
+                            coin = asset_data.get('coin', '').upper()
+                            mark_px = float(asset_data.get('markPx', 0))
+                            if coin and mark_px > 0:
+                                mark_prices[coin] = mark_px
+                        return mark_prices
         except Exception as e:
             logger.debug(f"Failed to fetch mark prices from local node: {e}")
 
@@ -520,11 +656,11 @@ class PositionUpdater:
         """Fetch margin tier table from local node."""
         try:
             if hasattr(self.config, 'local_node_url'):
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    payload = {"type": "marginTable"}
-                    async with session.post(f"{self.config.local_node_url}/info", json=payload) as response:
-                        if response.status == 200:
-                            return await response.json()
+                payload = {"type": "marginTable"}
+                async with self.session.post(f"{self.config.local_node_url}/info", json=payload,
+                                             timeout=_LOCAL_NODE_TIMEOUT) as response:
+                    if response.status == 200:
+                        return await response.json()
         except Exception as e:
             logger.debug(f"Failed to fetch margin table from local node: {e}")
 
@@ -540,9 +676,10 @@ class PositionUpdater:
         # Try local node first if configured
         if hasattr(self.config, 'local_node_url') and source == APISource.NVN:
             try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    payload = {"type": "clearinghouseState", "user": address}
-                    async with session.post(f"{self.config.local_node_url}/info", json=payload) as response:
+                payload = {"type": "clearinghouseState", "user": address}
+                async with self._local_sem:
+                    async with self.session.post(f"{self.config.local_node_url}/info", json=payload,
+                                                 timeout=_LOCAL_NODE_TIMEOUT) as response:
                         if response.status == 200:
                             return await response.json()
             except Exception as e:
@@ -560,23 +697,28 @@ class PositionUpdater:
             "user": normalized_address
         }
 
+        sem = self._sems[source]
         for attempt in range(self.config.max_retries):
             try:
-                async with self.session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        if source == APISource.NVN:
-                            self.api_stats['nvn_success'] += 1
-                        else:
-                            self.api_stats['public_success'] += 1
+                # Hold the slot only for the request itself, not the backoff sleeps
+                async with sem:
+                    async with self.session.post(url, json=payload) as response:
+                        status = response.status
+                        if status == 200:
+                            data = await response.json()
 
-                        return data
+                if status == 200:
+                    if source == APISource.NVN:
+                        self.api_stats['nvn_success'] += 1
                     else:
-                        logger.warning(f"{source.value} API status {response.status} for {address}")
-                        # Backoff especially for 429 (rate limit) or 5xx errors
-                        if response.status in [429, 500, 502, 503, 504]:
-                            await asyncio.sleep(self._retry_backoff * (attempt + 1))
+                        self.api_stats['public_success'] += 1
+
+                    return data
+                else:
+                    logger.warning(f"{source.value} API status {status} for {address}")
+                    # Backoff especially for 429 (rate limit) or 5xx errors
+                    if status in [429, 500, 502, 503, 504]:
+                        await asyncio.sleep(self._retry_backoff * (attempt + 1))
 
             except asyncio.TimeoutError:
                 logger.warning(f"{source.value} API timeout for {address} (attempt {attempt + 1})")
@@ -598,7 +740,8 @@ class PositionUpdater:
         self,
         positions: Dict[str, Dict[str, Dict]],
         market: str,
-        all_batch_addresses: List[str]
+        all_batch_addresses: List[str],
+        log_details: bool = True
     ):
         """
         CRITICAL FIX: Properly handle both active and closed positions.
@@ -611,6 +754,7 @@ class PositionUpdater:
             positions: Dict of address -> positions data (None = API failure, {} = no positions)
             market: The market being processed
             all_batch_addresses: ALL addresses in this batch
+            log_details: Log the per-batch breakdown at INFO (discrepancies are always logged)
         """
         if not all_batch_addresses:
             return
@@ -700,46 +844,26 @@ class PositionUpdater:
                     seen_addresses.add(address)
                     break  # Only one position per address per market
 
-            # Helper functions for safe type conversion
-            def safe_float(value, default=0.0):
-                """Safely convert to float, handling None values."""
-                if value is None:
-                    return default if default is not None else None
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return default if default is not None else None
-
-            def safe_int(value, default=None):
-                """Safely convert to int, handling None values."""
-                if value is None:
-                    return default
-                try:
-                    return int(float(value))  # Convert via float first for strings like "10.0"
-                except (ValueError, TypeError):
-                    return default
-
             # Prepare position records with proper data types
+            market_up = market.upper()
             position_records = []
             for item in market_records:
-                address = item['address']
                 pos = item['position']
-
-                position_size = float(pos.get('position_size', 0))
+                leverage = pos.get('leverage') or {}
 
                 position_records.append({
-                    'address': address.lower(),
-                    'market': market.upper(),
-                    'position_size': position_size,
-                    'entry_price': safe_float(pos.get('entry_price'), None),
-                    'liquidation_price': safe_float(pos.get('liquidation_price'), None),
+                    'address': item['address'].lower(),
+                    'market': market_up,
+                    'position_size': float(pos.get('position_size', 0)),
+                    'entry_price': safe_float(pos.get('entry_price')),
+                    'liquidation_price': safe_float(pos.get('liquidation_price')),
                     'margin_used': safe_float(pos.get('margin_used'), 0.0),
                     'position_value': safe_float(pos.get('position_value'), 0.0),
                     'unrealized_pnl': safe_float(pos.get('unrealized_pnl'), 0.0),
-                    'return_on_equity': safe_float(pos.get('return_on_equity'), None),
-                    'leverage_type': pos.get('leverage', {}).get('type', 'cross'),
-                    'leverage_value': safe_int(pos.get('leverage', {}).get('value'), None),
-                    'leverage_raw_usd': safe_float(pos.get('leverage', {}).get('rawUsd'), 0.0),
+                    'return_on_equity': safe_float(pos.get('return_on_equity')),
+                    'leverage_type': leverage.get('type', 'cross'),
+                    'leverage_value': safe_int(leverage.get('value')),
+                    'leverage_raw_usd': safe_float(leverage.get('rawUsd'), 0.0),
                     'account_value': safe_float(pos.get('account_value'), 0.0),
                     'total_margin_used': safe_float(pos.get('total_margin_used'), 0.0),
                     'withdrawable': safe_float(pos.get('withdrawable'), 0.0)
@@ -762,11 +886,12 @@ class PositionUpdater:
                 logger.debug(f"⚠️ {market}: Skipped {len(addresses_to_skip)} addresses due to API failures")
 
             # DETAILED LOGGING for debugging mismatches
-            logger.info(f"📊 {market} Batch Details:")
-            logger.info(f"   📥 Input: {len(all_batch_addresses)} addresses")
-            logger.info(f"   ✅ Active positions: {len(addresses_with_positions)} addresses → {len(position_records)} records")
-            logger.info(f"   🗑️ To remove: {len(addresses_to_remove)} addresses")
-            logger.info(f"   ⚠️ API failures: {len(addresses_to_skip)} addresses")
+            if log_details:
+                logger.info(f"📊 {market} Batch Details:")
+                logger.info(f"   📥 Input: {len(all_batch_addresses)} addresses")
+                logger.info(f"   ✅ Active positions: {len(addresses_with_positions)} addresses → {len(position_records)} records")
+                logger.info(f"   🗑️ To remove: {len(addresses_to_remove)} addresses")
+                logger.info(f"   ⚠️ API failures: {len(addresses_to_skip)} addresses")
 
             # Log any discrepancy between active addresses and position records
             if len(addresses_with_positions) != len(position_records):
@@ -818,11 +943,8 @@ class PositionUpdater:
                     logger.info(f"   Snapshot has: {len(snapshot_addresses)} addresses")
                     logger.info(f"   Removing: {len(addresses_to_remove)} stale addresses")
 
-                    # Remove in chunks to avoid query size limits
-                    chunk_size = 100
-                    for i in range(0, len(addresses_to_remove), chunk_size):
-                        chunk = addresses_to_remove[i:i+chunk_size]
-                        await self.db.queries.bulk_remove_addresses(token, chunk)
+                    # bulk_remove_addresses chunks internally on a single connection
+                    await self.db.queries.bulk_remove_addresses(token, addresses_to_remove)
 
                     logger.info(f"✅ {market}: Removed {len(addresses_to_remove)} stale addresses from database")
                     total_removed += len(addresses_to_remove)
@@ -878,12 +1000,30 @@ class PositionUpdater:
 
             logger.info(f"Checking {len(addresses)} {market} removal candidates")
 
-            for address in addresses:
-                positions = await self._get_user_positions(address, [market])
-
-                # Check if position is closed or doesn't exist
-                if not positions or not positions.get(market) or positions.get(market, {}).get('closed', False):
-                    closed_positions[market].add(address)
+            # Checked concurrently a batch at a time, so only one batch of tasks exists at once.
+            # Removal is only confirmed against a fresh state, never a cached one
+            addresses = list(addresses)
+            batch_size = self.config.position_refresh_batch_size
+            failed = 0
+            for i in range(0, len(addresses), batch_size):
+                batch = addresses[i:i + batch_size]
+                results = await asyncio.gather(
+                    *(self._get_user_positions(address, [market], use_cache=False) for address in batch)
+                )
+
+                for address, positions in zip(batch, results):
+                    # A failed fetch says nothing about the position; keep the address for the next check
+                    if positions is None:
+                        failed += 1
+                        continue
+                    # Check if position is closed or doesn't exist
+                    if not positions.get(market) or positions[market].get('closed', False):
+                        closed_positions[market].add(address)
+                        # Any cached state still shows the position, so it is stale
+                        self.invalidate_state(address)
+
+            if failed:
+                logger.warning(f"{market}: Could not fetch state for {failed} removal candidates; they stay candidates")
 
         return closed_positions
 
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 import msgpack
 import hashlib
 import logging
@@ -7,7 +8,6 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Set, Optional, Tuple, Any, List
 from dataclasses import dataclass
-from decimal import Decimal
 
 from config.constants import (
     ProcessingStatus,
@@ -19,6 +19,8 @@ from core.utils import is_ethereum_address
 
 logger = logging.getLogger(__name__)
 
+_POSITION_SIZE_FIELDS = ('szi', 's', 'sz', 'size', 'amount')
+
 @dataclass
 class SnapshotMetadata:
     path: Path
@@ -37,6 +39,7 @@ class SnapshotProcessor:
         self.state_file = config.data_dir / ".snapshot_state.json"
         self.processed_snapshots: Dict[str, SnapshotMetadata] = {}
         self.max_cache_size = FileConfig.MAX_SNAPSHOT_CACHE_SIZE
+        self._hash_cache: Dict[Tuple[str, int, int], str] = {}
         self._load_state()
 
     def _load_state(self) -> None:
@@ -78,7 +81,7 @@ class SnapshotProcessor:
                     'size': metadata.size,
                     'hash': metadata.hash,
                     'processed_at': metadata.processed_at.isoformat() if metadata.processed_at else None,
-                    'status': metadata.status.value
+                    'status': metadata.status
                 }
 
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
@@ -92,14 +95,26 @@ class SnapshotProcessor:
     def _calculate_file_hash(self, path: Path) -> str:
         sha256_hash = hashlib.sha256()
         try:
+            block_size = FileConfig.HASH_BLOCK_SIZE
             with open(path, "rb") as f:
-                for byte_block in iter(lambda: f.read(FileConfig.HASH_BLOCK_SIZE), b""):
+                for byte_block in iter(lambda: f.read(block_size), b""):
                     sha256_hash.update(byte_block)
             return sha256_hash.hexdigest()[:16]
         except Exception as e:
             logger.error(f"Failed to hash file {path}: {e}")
             return str(path)
 
+    def _get_file_hash(self, path: Path, stat: os.stat_result) -> str:
+        """Hash a snapshot file, reusing the previous hash while size and mtime are unchanged."""
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        file_hash = self._hash_cache.get(key)
+        if file_hash is None:
+            file_hash = self._calculate_file_hash(path)
+            if len(self._hash_cache) >= self.max_cache_size:
+                self._hash_cache.clear()
+            self._hash_cache[key] = file_hash
+        return file_hash
+
     async def find_latest_unprocessed_snapshot(self) -> Optional[SnapshotMetadata]:
         if not self.config.rmp_base_path.exists():
             logger.warning(f"RMP base path does not exist: {self.config.rmp_base_path}")
@@ -113,16 +128,17 @@ class SnapshotProcessor:
 
                 for rmp_file in sorted(date_dir.glob("*.rmp"), reverse=True):
                     try:
-                        if rmp_file.stat().st_size < 1000:
+                        stat = rmp_file.stat()
+                        if stat.st_size < 1000:
                             continue
 
                         height = int(rmp_file.stem)
-                        file_hash = self._calculate_file_hash(rmp_file)
+                        file_hash = self._get_file_hash(rmp_file, stat)
                         metadata = SnapshotMetadata(
                             path=rmp_file,
                             height=height,
                             date=date_dir.name,
-                            size=rmp_file.stat().st_size,
+                            size=stat.st_size,
                             hash=file_hash
                         )
 
@@ -136,7 +152,7 @@ class SnapshotProcessor:
                             return metadata
 
                     except (ValueError, OSError) as e:
-                        logger.debug(f"Invalid RMP file {rmp_file}: {e}")
+                        logger.debug("Invalid RMP file %s: %s", rmp_file, e)
                         continue
 
                 if candidates:
@@ -268,8 +284,9 @@ class SnapshotProcessor:
             logger.info(f"🔄 DIRECT RMP PARSING from {rmp_path}...")
             logger.info(f"File size: {rmp_path.stat().st_size / (1024*1024):.1f}MB")
 
-            with open(rmp_path, 'rb') as f:
-                data = msgpack.unpack(f, raw=False, strict_map_key=False)
+            # Decode on a worker thread so the event loop keeps serving other tasks
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, self._load_rmp, rmp_path)
 
             logger.info("✅ Successfully loaded RMP data into memory")
 
@@ -384,6 +401,11 @@ class SnapshotProcessor:
 
         return result
 
+    @staticmethod
+    def _load_rmp(rmp_path: Path) -> Dict:
+        with open(rmp_path, 'rb') as f:
+            return msgpack.unpack(f, raw=False, strict_map_key=False)
+
     def _process_user_positions_direct(
         self,
         address: str,
@@ -397,6 +419,7 @@ class SnapshotProcessor:
         Uses the same exact logic as extract_link_from_rmp_direct.py
         """
         positions_found = 0
+        min_value = self.config.min_position_size_usd
 
         try:
             # NEW FORMAT: assetPositions with szi (same as direct parser)
@@ -410,16 +433,16 @@ class SnapshotProcessor:
                             if coin in market_to_index:
                                 szi_str = position.get('szi', '0')
                                 try:
-                                    szi = Decimal(str(szi_str))
+                                    szi = float(szi_str)
                                     if szi != 0:
                                         position_value_usd = self._calculate_position_value_from_snapshot(
-                                            position, float(szi), market_to_price.get(coin, 1.0)
+                                            position, szi, market_to_price.get(coin, 1.0)
                                         )
 
-                                        if position_value_usd >= self.config.min_position_size_usd:
+                                        if position_value_usd >= min_value:
                                             result[coin].add(address)
                                             positions_found += 1
-                                            logger.debug(f"✓ {coin} position: {address} size={szi} value=${position_value_usd:.2f}")
+                                            logger.debug("✓ %s position: %s size=%s value=$%.2f", coin, address, szi, position_value_usd)
                                 except (ValueError, TypeError):
                                     continue
 
@@ -443,21 +466,21 @@ class SnapshotProcessor:
                         if target_market and isinstance(pos_data, dict):
                             size_value = pos_data.get('s') or pos_data.get('sz', '0')
                             try:
-                                size = Decimal(str(size_value))
+                                size = float(size_value)
                                 if size != 0:
                                     position_value_usd = self._calculate_position_value_from_snapshot(
-                                        pos_data, float(size), market_to_price.get(target_market, 1.0)
+                                        pos_data, size, market_to_price.get(target_market, 1.0)
                                     )
 
-                                    if position_value_usd >= self.config.min_position_size_usd:
+                                    if position_value_usd >= min_value:
                                         result[target_market].add(address)
                                         positions_found += 1
-                                        logger.debug(f"✓ {target_market} legacy position: {address} size={size} value=${position_value_usd:.2f}")
+                                        logger.debug("✓ %s legacy position: %s size=%s value=$%.2f", target_market, address, size, position_value_usd)
                             except (ValueError, TypeError):
                                 continue
 
         except Exception as e:
-            logger.debug(f"Error processing positions for {address}: {e}")
+            logger.debug("Error processing positions for %s: %s", address, e)
 
         return positions_found
 
@@ -598,7 +621,7 @@ class SnapshotProcessor:
                                     asset_ctxs_found = True
                                     break
                             except json.JSONDecodeError as e:
-                                logger.debug(f"JSON decode error in asset_ctxs extraction: {e}")
+                                logger.debug("JSON decode error in asset_ctxs extraction: %s", e)
 
                         # Keep only the end of buffer
                         if len(buffer) > chunk_size * 2:
@@ -687,7 +710,7 @@ class SnapshotProcessor:
                                                         if processed_count % 1000 == 0:
                                                             logger.info(f"Processed {processed_count} users, found {total_positions_found} positions...")
                                     except (json.JSONDecodeError, KeyError, ValueError) as e:
-                                        logger.debug(f"Error processing user entry: {e}")
+                                        logger.debug("Error processing user entry: %s", e)
 
                                     user_buffer = ""  # Reset for next user
 
@@ -719,6 +742,7 @@ class SnapshotProcessor:
         Returns the number of positions found for this user.
         """
         positions_found = 0
+        min_value = self.config.min_position_size_usd
 
         try:
             # NEW FORMAT: assetPositions with szi
@@ -730,13 +754,13 @@ class SnapshotProcessor:
                     if coin in market_to_index:
                         szi_str = position.get('szi', '0')
                         try:
-                            szi = Decimal(str(szi_str))
+                            szi = float(szi_str)
                             if szi != 0:
                                 position_value_usd = self._calculate_position_value_from_snapshot(
-                                    position, float(szi), market_to_price.get(coin, 1.0)
+                                    position, szi, market_to_price.get(coin, 1.0)
                                 )
 
-                                if position_value_usd >= self.config.min_position_size_usd:
+                                if position_value_usd >= min_value:
                                     result[coin].add(address)
                                     positions_found += 1
                         except (ValueError, TypeError):
@@ -762,20 +786,20 @@ class SnapshotProcessor:
                         if target_market and isinstance(pos_data, dict):
                             size_value = pos_data.get('s') or pos_data.get('sz', '0')
                             try:
-                                size = Decimal(str(size_value))
+                                size = float(size_value)
                                 if size != 0:
                                     position_value_usd = self._calculate_position_value_from_snapshot(
-                                        pos_data, float(size), market_to_price.get(target_market, 1.0)
+                                        pos_data, size, market_to_price.get(target_market, 1.0)
                                     )
 
-                                    if position_value_usd >= self.config.min_position_size_usd:
+                                    if position_value_usd >= min_value:
                                         result[target_market].add(address)
                                         positions_found += 1
                             except (ValueError, TypeError):
                                 continue
 
         except Exception as e:
-            logger.debug(f"Error processing positions for {address}: {e}")
+            logger.debug("Error processing positions for %s: %s", address, e)
 
         return positions_found
 
@@ -807,17 +831,9 @@ class SnapshotProcessor:
             logger.info(f"✓ Derived indices for {len(market_to_index)} markets")
             logger.info(f"✓ Extracted prices for {len(market_to_price)} markets")
 
-            # System addresses to filter out
-            system_addresses = {
-                '0x0000000000000000000000000000000000000000',
-                '0x0000000000000000000000000000000000000001',
-                '0x000000000000000000000000000000000000dead',
-                '0xffffffffffffffffffffffffffffffffffffffff'
-            }
-
             # Parse positions using chunked streaming to avoid memory issues
             total_positions_found = await self._extract_positions_chunked(
-                json_path, market_to_index, market_to_price, system_addresses, result
+                json_path, market_to_index, market_to_price, SYSTEM_ADDRESSES, result
             )
 
             # INVARIANT CHECK: Ensure we didn't over-extract
@@ -917,31 +933,13 @@ class SnapshotProcessor:
 
     def extract_position_size(self, pos_data: Dict) -> float:
         """Extract position size supporting both new (szi) and old (s) formats."""
-        # NEW FORMAT: 'szi' field
-        if 'szi' in pos_data:
-            value = pos_data['szi']
-            if isinstance(value, (int, float, str)):
-                try:
-                    return float(Decimal(str(value)))
-                except (ValueError, TypeError):
-                    pass
-
-        # OLD FORMAT: 's' field
-        if 's' in pos_data:
-            value = pos_data['s']
-            if isinstance(value, (int, float, str)):
-                try:
-                    return float(Decimal(str(value)))
-                except (ValueError, TypeError):
-                    pass
-
-        # Fallback fields
-        for field in ['sz', 'size', 'amount']:
+        # NEW FORMAT 'szi', OLD FORMAT 's', then fallback fields
+        for field in _POSITION_SIZE_FIELDS:
             if field in pos_data:
                 value = pos_data[field]
                 if isinstance(value, (int, float, str)):
                     try:
-                        return float(Decimal(str(value)))
+                        return float(value)
                     except (ValueError, TypeError):
                         pass
 
@@ -960,9 +958,9 @@ class SnapshotProcessor:
                 for old_file in json_files[self.config.snapshot_retention_count:]:
                     try:
                         old_file.unlink()
-                        logger.debug(f"Deleted old snapshot: {old_file.name}")
+                        logger.debug("Deleted old snapshot: %s", old_file.name)
                     except Exception as e:
-                        logger.warning(f"Could not delete {old_file}: {e}")
+                        logger.warning("Could not delete %s: %s", old_file, e)
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
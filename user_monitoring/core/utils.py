@@ -1,24 +1,55 @@
 """Utility functions for Hyperliquid Position Monitoring System."""
-from typing import Any, Optional
+import mmap
+import os
+import re
+from functools import lru_cache
+from typing import Any, List, Optional, Union
 
-from config.constants import ADDRESS_LENGTH, ADDRESS_PREFIX, HEX_CHARS
+from config.constants import ADDRESS_CACHE_SIZE, ADDRESS_LENGTH, ADDRESS_PREFIX, HEX_CHARS
+
+_HEX_BYTES = HEX_CHARS.encode('ascii')
+_ADDRESS_LINE_BYTES_RE = re.compile(rb'^[ \t]*(0[xX][0-9a-fA-F]{40})[ \t]*\r?$', re.MULTILINE)
 
 
 def is_ethereum_address(address: str) -> bool:
     if not isinstance(address, str):
         return False
+    return _is_ethereum_address(address)
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _is_ethereum_address(address: str) -> bool:
     address = address.strip()
     return (
         len(address) == ADDRESS_LENGTH and
         address[:2].lower() == ADDRESS_PREFIX and
-        all(c in HEX_CHARS for c in address[2:])
+        address.isascii() and
+        not address[2:].encode('ascii').translate(None, _HEX_BYTES)
     )
 
 
+def read_ethereum_addresses(path: Union[str, os.PathLike]) -> List[str]:
+    """Return every single-address line of a file, lowercased, scanning it memory-mapped as bytes."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [m.decode('ascii').lower() for m in _ADDRESS_LINE_BYTES_RE.findall(mm)]
+
+
 def safe_float(value: Any, default: Optional[float] = None) -> Optional[float]:
     if value is None:
         return default
     try:
         return float(value)
     except (ValueError, TypeError):
-        return default
\ No newline at end of file
+        return default
+
+
+def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
+    if value is None:
+        return default
+    try:
+        return int(float(value))  # Via float so strings like "10.0" parse
+    except (ValueError, TypeError):
+        return default
@@ -1,5 +1,6 @@
 """Database manager for user metrics tables."""
 import asyncpg
+import hashlib
 import logging
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Any
@@ -11,9 +12,29 @@ from .queries import UserMetricsQueries
 
 logger = logging.getLogger(__name__)
 
+# Schema DDL is read once at import; its hash is stamped on the schema so warm
+# starts (and concurrent workers) can skip re-running the DDL.
+_SCHEMA_FILE = Path(__file__).parent / "schema.sql"
+_SCHEMA_SQL: Optional[str] = _SCHEMA_FILE.read_text(encoding='utf-8') if _SCHEMA_FILE.exists() else None
+_SCHEMA_VERSION: Optional[str] = hashlib.sha256(_SCHEMA_SQL.encode('utf-8')).hexdigest()[:16] if _SCHEMA_SQL else None
+_SCHEMA_LOCK_KEY = "anthias_schema"
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Per-connection setup: decode NUMERIC as float instead of Decimal."""
+    await conn.set_type_codec(
+        'numeric',
+        encoder=str,
+        decoder=float,
+        schema='pg_catalog',
+        format='text'
+    )
+
 
 class DatabaseManager:
 
+    __slots__ = ('config', 'pool', 'queries')
+
     def __init__(self, config):
         self.config = config
         self.pool: Optional[asyncpg.Pool] = None
@@ -24,11 +45,21 @@ class DatabaseManager:
         try:
             self.pool = await asyncpg.create_pool(
                 self.config.database_url,
-                min_size=DatabaseConfig.MIN_POOL_SIZE,
-                max_size=DatabaseConfig.MAX_POOL_SIZE,
+                min_size=self.config.db_min_pool_size,
+                max_size=self.config.db_max_pool_size,
                 command_timeout=DatabaseConfig.COMMAND_TIMEOUT,
-                statement_cache_size=0,
-                server_settings={'jit': 'off'}
+                statement_cache_size=self.config.db_statement_cache_size,
+                max_inactive_connection_lifetime=DatabaseConfig.MAX_INACTIVE_CONNECTION_LIFETIME,
+                server_settings={
+                    'jit': 'off',
+                    'application_name': DatabaseConfig.APPLICATION_NAME
+                },
+                init=_init_connection
+            )
+
+            logger.info(
+                f"Database pool: min={self.config.db_min_pool_size} max={self.config.db_max_pool_size} "
+                f"statement_cache={self.config.db_statement_cache_size}"
             )
 
             await self._create_schema()
@@ -49,15 +80,26 @@ class DatabaseManager:
             logger.info("Database pool closed")
 
     async def _create_schema(self):
-        schema_file = Path(__file__).parent / "schema.sql"
-        if not schema_file.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_file}")
-        with open(schema_file, 'r', encoding='utf-8') as f:
-            schema_sql = f.read()
+        if _SCHEMA_SQL is None:
+            raise FileNotFoundError(f"Schema file not found: {_SCHEMA_FILE}")
+
+        version_tag = f"schema:{_SCHEMA_VERSION}"
         async with self.pool.acquire() as conn:
-            await conn.execute(schema_sql)
+            async with conn.transaction():
+                # Serialize schema setup across workers; released on commit
+                await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", _SCHEMA_LOCK_KEY)
+
+                applied = await conn.fetchval(
+                    "SELECT obj_description(to_regnamespace('user_metrics'), 'pg_namespace')"
+                )
+                if applied == version_tag:
+                    logger.info(f"Database schema up to date ({_SCHEMA_VERSION}), skipping DDL")
+                    return
+
+                await conn.execute(_SCHEMA_SQL)
+                await conn.execute(f"COMMENT ON SCHEMA user_metrics IS '{version_tag}'")
 
-            logger.info(f"Database schema initialized from {schema_file.name}")
+            logger.info(f"Database schema initialized from {_SCHEMA_FILE.name} ({_SCHEMA_VERSION})")
             logger.info("Token-specific tables will be created as needed")
 
     async def _ensure_market_tables(self):
@@ -4,10 +4,44 @@ Provides descriptive method names for all database operations.
 """
 import asyncpg
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
+
+from config.constants import DatabaseConfig
 
 logger = logging.getLogger(__name__)
 
+_POSITION_COLUMNS = (
+    'address', 'market', 'position_size', 'entry_price', 'liquidation_price',
+    'margin_used', 'position_value', 'unrealized_pnl', 'return_on_equity',
+    'leverage_type', 'leverage_value', 'leverage_raw_usd', 'account_value',
+    'total_margin_used', 'withdrawable'
+)
+_POSITION_COLUMN_LIST = ', '.join(_POSITION_COLUMNS)
+
+# Numeric columns are staged as float8 so COPY can use asyncpg's binary encoders
+# (NUMERIC is registered with a text codec); seq keeps last-write-wins for duplicates.
+_STAGING_TABLE = 'positions_stage'
+_CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    seq BIGSERIAL,
+    address TEXT,
+    market TEXT,
+    position_size FLOAT8,
+    entry_price FLOAT8,
+    liquidation_price FLOAT8,
+    margin_used FLOAT8,
+    position_value FLOAT8,
+    unrealized_pnl FLOAT8,
+    return_on_equity FLOAT8,
+    leverage_type TEXT,
+    leverage_value FLOAT8,
+    leverage_raw_usd FLOAT8,
+    account_value FLOAT8,
+    total_margin_used FLOAT8,
+    withdrawable FLOAT8
+) ON COMMIT DELETE ROWS
+"""
+
 
 class UserMetricsQueries:
     """
@@ -36,13 +70,14 @@ class UserMetricsQueries:
         table_name = self._get_table_name(token)
 
         query = f"""
-        INSERT INTO {table_name} (
+        INSERT INTO {table_name} ({_POSITION_COLUMN_LIST}, last_updated)
+        SELECT DISTINCT ON (address, market)
             address, market, position_size, entry_price, liquidation_price,
             margin_used, position_value, unrealized_pnl, return_on_equity,
-            leverage_type, leverage_value, leverage_raw_usd, account_value,
-            total_margin_used, withdrawable, last_updated
-        )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, NOW())
+            leverage_type, leverage_value::integer, leverage_raw_usd, account_value,
+            total_margin_used, withdrawable, NOW()
+        FROM {_STAGING_TABLE}
+        ORDER BY address, market, seq DESC
         ON CONFLICT (address, market)
         DO UPDATE SET
             position_size = EXCLUDED.position_size,
@@ -87,9 +122,19 @@ class UserMetricsQueries:
         for attempt in range(max_retries):
             try:
                 async with self.pool.acquire() as conn:
-                    # Set transaction isolation to reduce deadlock chances
-                    await conn.execute("SET LOCAL lock_timeout = '5s'")
-                    await conn.executemany(query, batch_data)
+                    async with conn.transaction():
+                        # Set transaction isolation to reduce deadlock chances
+                        await conn.execute("SET LOCAL lock_timeout = '5s'")
+                        # COPY rows into a per-connection staging table, then upsert in one statement
+                        await conn.execute(_CREATE_STAGING_SQL)
+                        chunk_size = DatabaseConfig.INSERT_COPY_CHUNK_SIZE
+                        for i in range(0, len(batch_data), chunk_size):
+                            await conn.copy_records_to_table(
+                                _STAGING_TABLE,
+                                records=batch_data[i:i + chunk_size],
+                                columns=_POSITION_COLUMNS
+                            )
+                        await conn.execute(query)
                     break  # Success, exit retry loop
             except Exception as e:
                 if "deadlock detected" in str(e).lower() and attempt < max_retries - 1:
@@ -210,7 +255,7 @@ class UserMetricsQueries:
             rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
 
-    async def calculate_overall_stats(self, token: str, min_value: float) -> Dict[str, Any]:
+    async def calculate_overall_stats(self, token: str, min_value: float) -> Mapping[str, Any]:
         """
         Calculate overall statistics for a token.
         2-3 words: calculate_overall_stats
@@ -232,7 +277,8 @@ class UserMetricsQueries:
 
         async with self.pool.acquire() as conn:
             result = await conn.fetchrow(query, min_value)
-            return dict(result) if result else {}
+            # Record is already a read-only mapping; no need to copy it into a dict
+            return result if result is not None else {}
 
     async def bulk_remove_addresses_transactional(
         self, conn, token: str, addresses: List[str]
@@ -315,7 +361,7 @@ class UserMetricsQueries:
             ))
 
         # Execute in chunks for performance
-        chunk_size = 500
+        chunk_size = DatabaseConfig.INSERT_CHUNK_SIZE
         for i in range(0, len(batch_data), chunk_size):
             chunk = batch_data[i:i+chunk_size]
             await conn.executemany(query, chunk)
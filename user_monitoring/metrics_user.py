@@ -200,10 +200,10 @@ def monitor_snapshot_processing(func):
     """Monitor snapshot processing operations."""
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = await func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             USER_SNAPSHOTS_PROCESSED.labels(status='success').inc()
             USER_SNAPSHOT_DURATION.observe(duration)
@@ -232,10 +232,10 @@ def monitor_position_update(func):
     """Monitor position update operations."""
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = await func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             PROCESSING_CYCLE_DURATION.labels(cycle_type='position_update').observe(duration)
             COMPONENT_LAST_SUCCESS.labels(component='position_updater').set(time.time())
@@ -263,10 +263,10 @@ def monitor_api_query(query_type: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 USER_API_QUERIES.labels(query_type=query_type, status='success').inc()
                 USER_API_DURATION.labels(query_type=query_type).observe(duration)
@@ -291,10 +291,10 @@ def monitor_db_operation(operation: str, table: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 USER_DB_OPERATIONS.labels(
                     operation=operation,
@@ -403,14 +403,19 @@ def update_monitor_uptime(start_time: float):
 # SYSTEM METRICS FOR USER MONITORING
 # =============================================================================
 
+_PROCESS = None
+
 def update_user_system_metrics(process_name: str = 'user_monitoring'):
     """Update system-level metrics for user monitoring."""
+    global _PROCESS
     try:
         import psutil
         import threading
         
-        # Get current process
-        process = psutil.Process()
+        # Reuse one Process handle so cpu_percent() can measure since the last tick
+        if _PROCESS is None:
+            _PROCESS = psutil.Process()
+        process = _PROCESS
         
         # Memory metrics - reuse from market metrics if available
         from metrics_market import PYTHON_MEMORY_USAGE, CPU_USAGE_PERCENT, THREAD_COUNT
@@ -418,8 +423,8 @@ def update_user_system_metrics(process_name: str = 'user_monitoring'):
         memory_info = process.memory_info()
         PYTHON_MEMORY_USAGE.labels(process_name=process_name).set(memory_info.rss)
         
-        # CPU metrics
-        cpu_percent = process.cpu_percent(interval=0.1)
+        # CPU metrics (non-blocking; first call after startup reports 0.0)
+        cpu_percent = process.cpu_percent(interval=None)
         CPU_USAGE_PERCENT.labels(process_name=process_name).set(cpu_percent)
         
         # Thread count
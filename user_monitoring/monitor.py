@@ -11,7 +11,7 @@ from pathlib import Path
 import traceback
 
 from config.config import MonitorConfig
-from config.logging_config import LoggingSetup
+from config.logging_config import setup_logging
 from config.constants import (
     SystemState,
     ProcessingIntervals,
@@ -75,7 +75,7 @@ class HyperliquidMonitor:
         self.config = config
 
         log_dir = config.data_dir / "logs"
-        self.logger = LoggingSetup.setup_logging(log_dir, log_level="INFO")
+        self.logger = setup_logging(log_dir, log_level="INFO")
 
         self.state = SystemState.INITIALIZING
         self.running = False
@@ -544,6 +544,11 @@ class HyperliquidMonitor:
         except Exception as e:
             self.logger.error(f"Error stopping position updater: {e}")
 
+        try:
+            await self.address_manager.flush()
+        except Exception as e:
+            self.logger.error(f"Error saving address files: {e}")
+
         try:
             await self.db_manager.close()
         except Exception as e: